@@ -1,24 +1,17 @@
 import logging
 import os
+import subprocess
 import sys
 
-from PySide6.QtWidgets import QApplication
-from PySide6.QtCore import QUrl
-from PySide6.QtGui import QDesktopServices
-from PySide6.QtWidgets import QDialog
-
-from snapcast_gui.windows.combined_window import CombinedWindow
-from snapcast_gui.fileactions.file_folder_checks import FileFolderChecks
-from snapcast_gui.windows.main_window import MainWindow
-from snapcast_gui.misc.notifications import Notifications
-from snapcast_gui.windows.client_window import ClientWindow
-from snapcast_gui.windows.server_window import ServerWindow
-from snapcast_gui.windows.settings_window import SettingsWindow
-
-from snapcast_gui.fileactions.snapcast_settings import SnapcastSettings
-from snapcast_gui.misc.snapcast_gui_variables import SnapcastGuiVariables
 from snapcast_gui.misc.logger_setup import LoggerSetup
-from snapcast_gui.dialogs.path_input_dialog import PathInputDialog
+
+_LOG_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
 
 def read_log_level(log_level_file_path: str) -> int:
     """
@@ -31,32 +24,39 @@ def read_log_level(log_level_file_path: str) -> int:
         FileNotFoundError: If the log level file is not found.
         Exception: If there is an error opening the log level file.
     """
+    write_default = False
     try:
-        with open(log_level_file_path, "r+") as file:
-            first_line = file.readline().strip().upper()
-            if first_line == "":
-                log_level = logging.INFO
-                file.write("INFO\n")
-            else:
-                log_level = {
-                    "DEBUG": logging.DEBUG,
-                    "INFO": logging.INFO,
-                    "WARNING": logging.WARNING,
-                    "ERROR": logging.ERROR,
-                    "CRITICAL": logging.CRITICAL,
-                }.get(first_line, logging.INFO)
-    except FileNotFoundError:
-        with open(log_level_file_path, "w") as file:
+        fd = os.open(log_level_file_path, os.O_RDONLY)
+        try:
+            content = os.read(fd, 32)
+        finally:
+            os.close(fd)
+        first_line = content.decode(errors="ignore").partition("\n")[0].strip().upper()
+        if first_line == "":
             log_level = logging.INFO
-            file.write("INFO\n")
+            write_default = True
+        else:
+            log_level = _LOG_LEVELS.get(first_line, logging.INFO)
+    except FileNotFoundError:
+        log_level = logging.INFO
+        write_default = True
     except IsADirectoryError:
         os.removedirs(os.path.dirname(log_level_file_path))
         print("File path is a directory. Removing directory.")
         log_level = logging.INFO
     except Exception as e:
+        from snapcast_gui.misc.notifications import Notifications
+
         Notifications.send_notify("Error", f"Error opening log level file: {e}")
         log_level = logging.DEBUG
 
+    if write_default:
+        try:
+            with open(log_level_file_path, "w") as file:
+                file.write("INFO\n")
+        except OSError as e:
+            print("Could not write default log level: {}".format(e))
+
     return log_level
 
 def open_file(file_path: str) -> None:
@@ -65,23 +65,90 @@ def open_file(file_path: str) -> None:
 
     Args:
         file_path (str): The path to the file.
+
+    Exits with status 1 if no application could be started to open the file.
     """
-    from PySide6.QtGui import QGuiApplication
-    app = QGuiApplication([])
-    url = QUrl.fromLocalFile(file_path)
-    QDesktopServices.openUrl(url)
-    app.exit()
-    
-FileFolderChecks.ensure_folder_creation()
-FileFolderChecks.create_missing_files()
-FileFolderChecks.set_file_permission()
-
-log_level = read_log_level(SnapcastGuiVariables.log_level_file_path)
-log_file_path = SnapcastGuiVariables.log_file_path
-LoggerSetup.setup_logging(log_file_path, log_level)
+    try:
+        if sys.platform == "win32":
+            os.startfile(file_path)
+        elif sys.platform == "darwin":
+            subprocess.Popen(["open", file_path])
+        else:
+            subprocess.Popen(["xdg-open", file_path])
+    except OSError as e:
+        print("Could not open {}: {}".format(file_path, e))
+        sys.exit(1)
+
+def ensure_config_files() -> None:
+    """
+    Creates the config folder and files if they are missing and fixes their permissions.
+    """
+    from snapcast_gui.fileactions.file_folder_checks import FileFolderChecks
+
+    FileFolderChecks.ensure_folder_creation()
+    FileFolderChecks.create_missing_files()
+    FileFolderChecks.set_file_permission()
 
 logger = LoggerSetup.get_logger("main")
 
+_HELP_TEXT = """Usage: python main.py
+Options:
+  -h / --help             Show this help message and exit
+  -v / --version          Show version and exit
+  -c / --config           Open settings file
+  -l / --log              Open log file
+  -i / --ip               Open ip file"""
+
+
+def _show_help() -> None:
+    logger.debug("Showing help message")
+    print(_HELP_TEXT)
+
+
+def _show_version() -> None:
+    from snapcast_gui.misc.snapcast_gui_variables import SnapcastGuiVariables
+
+    logger.debug("Showing version")
+    print("Snapcast-Gui version: {}".format(SnapcastGuiVariables.snapcast_gui_version))
+
+
+def _open_settings_file() -> None:
+    from snapcast_gui.misc.snapcast_gui_variables import SnapcastGuiVariables
+
+    ensure_config_files()
+    open_file(SnapcastGuiVariables.settings_file_path)
+    logger.debug("Opening settings file with open_file")
+
+
+def _open_log_file() -> None:
+    from snapcast_gui.misc.snapcast_gui_variables import SnapcastGuiVariables
+
+    ensure_config_files()
+    open_file(SnapcastGuiVariables.log_file_path)
+    logger.debug("Opening log file with open_file")
+
+
+def _open_log_level_file() -> None:
+    from snapcast_gui.misc.snapcast_gui_variables import SnapcastGuiVariables
+
+    ensure_config_files()
+    open_file(SnapcastGuiVariables.log_level_file_path)
+    logger.debug("Opening log level file with open_file")
+
+
+_CLI_HANDLERS = {
+    "-h": _show_help,
+    "--help": _show_help,
+    "-v": _show_version,
+    "--version": _show_version,
+    "-c": _open_settings_file,
+    "--config": _open_settings_file,
+    "-l": _open_log_file,
+    "--log": _open_log_file,
+    "-i": _open_log_level_file,
+    "--ip": _open_log_level_file,
+}
+
 
 def main():
     """
@@ -91,52 +158,39 @@ def main():
     creates the application and window objects, and starts the event loop.
     """
     if len(sys.argv) > 1:
-        option = sys.argv[1].lower()
-        if option == "-h" or option == "--help":
-            logger.debug("Showing help message")
-            print("Usage: python main.py")
-            print("Options:")
-            print("  -h / --help             Show this help message and exit")
-            print("  -v / --version          Show version and exit")
-            print("  -c / --config           Open settings file")
-            print("  -l / --log              Open log file")
-            print("  -i / --ip               Open ip file")
-            sys.exit(0)
-        elif option == "-v" or option == "--version":
-            logger.debug("Showing version")
-            print("Snapcast-Gui version: {}".format(SnapcastGuiVariables.snapcast_gui_version))
-        elif option == "-c" or option == "--config":
-            open_file(SnapcastGuiVariables.settings_file_path)
-            logger.debug("Opening settings file with open_file")
-            sys.exit(0)
-        elif option == "-l" or option == "--log":
-            open_file(SnapcastGuiVariables.log_file_path)
-            logger.debug("Opening log file with open_file")
-            sys.exit(0)
-        elif option == "-i" or option == "--ip":
-            open_file(SnapcastGuiVariables.log_level_file_path)
-            logger.debug("Opening log level file with open_file")
-            sys.exit(0)
-        else:
+        handler = _CLI_HANDLERS.get(sys.argv[1].lower())
+        if handler is None:
             logger.debug("Invalid argument")
             print("Invalid argument")
             print("")
-            print("Usage: python main.py")
-            print("Options:")
-            print("  -h / --help             Show this help message and exit")
-            print("  -v / --version          Show version and exit")
-            print("  -c / --config           Open settings file")
-            print("  -l / --log              Open log file")
-            print("  -i / --ip               Open ip file")
-
+            print(_HELP_TEXT)
             sys.exit(1)
+        handler()
+        sys.exit(0)
+
+    from snapcast_gui.misc.snapcast_gui_variables import SnapcastGuiVariables
+
+    ensure_config_files()
+    log_level = read_log_level(SnapcastGuiVariables.log_level_file_path)
+    LoggerSetup.setup_logging(SnapcastGuiVariables.log_file_path, log_level)
 
     logger.info("Starting Snapcast-Gui")
     logger.debug("sys.platform: {}".format(sys.platform))
 
-    snapcast_settings = SnapcastSettings(log_level)
+    from PySide6.QtWidgets import QApplication, QDialog
+
+    from snapcast_gui.fileactions.snapcast_settings import SnapcastSettings
+    from snapcast_gui.dialogs.path_input_dialog import PathInputDialog
+    from snapcast_gui.windows.client_window import ClientWindow
+    from snapcast_gui.windows.combined_window import CombinedWindow
+    from snapcast_gui.windows.main_window import MainWindow
+    from snapcast_gui.windows.server_window import ServerWindow
+    from snapcast_gui.windows.settings_window import SettingsWindow
+
+    snapcast_settings = SnapcastSettings()
 
     app = QApplication(sys.argv)
+    app.aboutToQuit.connect(snapcast_settings.sync)
     client_window = ClientWindow(snapcast_settings, log_level)
     main_window = MainWindow(snapcast_settings, client_window, log_level)
     server_window = ServerWindow(snapcast_settings, log_level)
@@ -167,19 +221,17 @@ def main():
 
     if not snapcast_settings.read_setting("snapclient/ignore_popup"):
         if not is_executable(snapclient_path):
-            dialog = PathInputDialog("snapclient", log_level)
+            dialog = PathInputDialog("snapclient", snapcast_settings, log_level)
             if dialog.exec() == QDialog.Accepted:
-                snapcast_settings.set_ignore_popup(dialog.ignore_popup_checkbox.isChecked())
                 new_path = dialog.get_path()
-                snapcast_settings.write_setting("snapclient/custom_path", new_path)
+                snapcast_settings.update_setting("snapclient/custom_path", new_path)
 
     if not snapcast_settings.read_setting("snapserver/ignore_popup"):
         if not is_executable(snapserver_path):
-            dialog = PathInputDialog("snapserver", log_level)
+            dialog = PathInputDialog("snapserver", snapcast_settings, log_level)
             if dialog.exec() == QDialog.Accepted:
-                snapcast_settings.set_ignore_popup(dialog.ignore_popup_checkbox.isChecked())
                 new_path = dialog.get_path()
-                snapcast_settings.write_setting("snapserver/custom_path", new_path)
+                snapcast_settings.update_setting("snapserver/custom_path", new_path)
 
     combined_window.show()
     sys.exit(app.exec())
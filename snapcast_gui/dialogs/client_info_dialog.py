@@ -1,11 +1,9 @@
 import logging
-import json
 
 from functools import partial
 from typing import TYPE_CHECKING
 from PySide6.QtGui import QIcon
-from PySide6.QtCore import Signal, Slot, QUrl
-from PySide6.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply
+from PySide6.QtCore import Slot, QTimer
 from PySide6.QtWidgets import (
     QDialog,
     QLabel,
@@ -15,8 +13,11 @@ from PySide6.QtWidgets import (
     QVBoxLayout,
     QSlider,
     QComboBox,
+    QFormLayout,
     QHBoxLayout,
     QMessageBox,
+    QGroupBox,
+    QWidget,
 )
 from snapcast_gui.misc.snapcast_gui_variables import SnapcastGuiVariables
 
@@ -24,8 +25,44 @@ if TYPE_CHECKING:
     from snapcast_gui.windows.main_window import MainWindow
 
 
+_TT_NAME = "Client's name"
+_TT_CHANGE_NAME = "Change the name of the client"
+_TT_IDENTIFIER = "Unique identifier for the client"
+_TT_VERSION = "Version of the client"
+_TT_CHECK_VERSION = "Check the version of the client"
+_TT_VOLUME = "Volume level of the client"
+_TT_CHANGE_VOLUME = "Change the volume of the client"
+_TT_MUTE = "Change the mute state of the client"
+_TT_LATENCY = "Latency of the client"
+_TT_CHANGE_LATENCY = "Change the latency of the client"
+_TT_DETAILS = "Version, latency, group and source of the client"
+_TT_GROUP_INFORMATION = "Information about the group the client belongs to"
+_TT_GROUP_NAME = "Name of the group the client belongs to"
+_TT_CHANGE_GROUP_NAME = "Change the group name of the client"
+_TT_GROUP_VOLUME = "Volume of the group the client belongs to"
+_TT_CHANGE_GROUP_VOLUME = "Change the volume of the group the client belongs to"
+_TT_GROUPS_AVAILABLE = "Groups available to join"
+_TT_SOURCES = "Sources available to join"
+_TT_CHANGE_SOURCE = "Change the source of the client"
+
+# (attribute, label, label tooltip, tooltip, client_info key, minimum, maximum, MainWindow slot)
+_VOLUME_FIELD = (
+    "volume_spinbox", "Volume", _TT_VOLUME, _TT_CHANGE_VOLUME,
+    "volume", 0, 100, "change_volume",
+)
+_LATENCY_FIELD = (
+    "latency_spinbox", "Latency", _TT_LATENCY, _TT_CHANGE_LATENCY,
+    "latency", -2000, 2000, "change_latency",
+)
+_GROUP_VOLUME_FIELD = (
+    "group_volume_spinbox", "Group Volume", _TT_GROUP_VOLUME, _TT_CHANGE_GROUP_VOLUME,
+    "group_volume", 0, 100, "change_group_volume",
+)
+
+
 class ClientInfoDialog(QDialog):
-    latest_version_fetched = Signal(str)
+    _ICON_MUTED = None
+    _ICON_UNMUTED = None
 
     def __init__(
         self,
@@ -45,72 +82,58 @@ class ClientInfoDialog(QDialog):
             client_info.get("identifier", "Unknown")))
 
         self.mainwindow = mainwindow
-        self.network_manager = QNetworkAccessManager(self)
-        self.network_manager.finished.connect(self.on_version_fetched)
+        self.client_info = client_info
+        self.slider = slider
+        self.mute_button = mute_button
+        self.client_label = client_label
+        self.sources_dictionary = sources_dictionary
+        self.version_checker = None
+        self._torn_down = False
 
         self.setWindowTitle(
             "Client Info for {}".format(
                 client_info.get("friendly_name", "Unknown"))
         )
 
-        self.layout = QVBoxLayout()
-
-        name_label = QLabel("Name")
-        name_label.setToolTip("Client's name")
-        self.layout.addWidget(name_label)
-        name = QTextEdit(self)
-        name.setText(client_info.get("friendly_name", ""))
-        name.setFixedHeight(30)
-        name.setToolTip("Change the name of the client")
-        name.textChanged.connect(
-            partial(
-                self.mainwindow.change_client_name,
-                client_uid=client_info.get("identifier", "Unknown"),
-                qtextedit=name,
-            )
-        )
-        name.textChanged.connect(client_label.setText(name.toPlainText()))
-        self.layout.addWidget(name)
-
-        identifier_label = QLabel("Identifier")
-        identifier_label.setToolTip("Unique identifier for the client")
-        self.layout.addWidget(identifier_label)
-        identifier_value = client_info.get("identifier", "Unknown")
-        identifier = QLabel(identifier_value)
-        identifier.setToolTip("Unique identifier for the client")
-        self.layout.addWidget(identifier)
-
-        version_layout = QHBoxLayout()
-
-        version_label = QLabel("Version")
-        version_label.setToolTip("Version of the client")
-        self.layout.addWidget(version_label)
-        version = QLabel()
-        version.setToolTip("Version of the client")
-        version_text: str = client_info.get("version", "Unknown")
-        version.setText(version_text)
-        version_layout.addWidget(version)
+        self.layout = QFormLayout()
 
-        self.check_version_button = QPushButton("Check Version")
-        self.check_version_button.setToolTip("Check the version of the client")
-        self.check_version_button.clicked.connect(self.check_version)
-        version_layout.addWidget(self.check_version_button)
-
-        self.layout.addLayout(version_layout)
-
-        volume_label = QLabel("Volume")
-        volume_label.setToolTip("Volume level of the client")
-        self.layout.addWidget(volume_label)
-        volume = QSpinBox(self)
-        volume.setToolTip("Change the volume of the client")
-        volume.setValue(client_info.get("volume", 0))
-        volume.setMinimum(0)
-        volume.setMaximum(100)
-        volume.valueChanged.connect(
-            partial(mainwindow.change_volume, client_info["identifier"])
+        self._build_essential()
+
+        self._extras_built = False
+        self.extras_box = QGroupBox("Details", self)
+        self.extras_box.setToolTip(_TT_DETAILS)
+        self.extras_box.setCheckable(True)
+        self.extras_box.setChecked(False)
+        self.extras_box.toggled.connect(self.toggle_extras)
+        self.extras_box_layout = QVBoxLayout(self.extras_box)
+        self.layout.addRow(self.extras_box)
+
+        self.setLayout(self.layout)
+
+    def _build_essential(self) -> None:
+        """
+        Builds the widgets that are always visible: name, identifier, volume and mute state.
+        """
+        client_info = self.client_info
+
+        self.name = QTextEdit(self)
+        self.name.setText(client_info.get("friendly_name", ""))
+        self.name.setFixedHeight(30)
+        self.name.setToolTip(_TT_CHANGE_NAME)
+        self._name_timer = QTimer(self)
+        self._name_timer.setSingleShot(True)
+        self._name_timer.setInterval(250)
+        self._name_timer.timeout.connect(self.apply_name_change)
+        self.name.textChanged.connect(self._name_timer.start)
+        self.layout.addRow(self._label("Name", _TT_NAME), self.name)
+
+        self.layout.addRow(
+            self._label("Identifier", _TT_IDENTIFIER),
+            self._label(client_info.get("identifier", "Unknown"), _TT_IDENTIFIER),
         )
-        volume.valueChanged.connect(lambda: slider.setValue(volume.value()))
-        self.layout.addWidget(volume)
+
+        volume = self._add_spin_field(self.layout, *_VOLUME_FIELD)
+        volume.valueChanged.connect(self.slider.setValue)
 
         self.muted = QPushButton("Muted", self)
         self.muted.setCheckable(True)
@@ -120,83 +143,199 @@ class ClientInfoDialog(QDialog):
         else:
             self.muted.setText("Mute")
             self.muted.setChecked(False)
-        self.muted.setToolTip("Change the mute state of the client")
+        self.muted.setToolTip(_TT_MUTE)
         self.muted.clicked.connect(
-            lambda: self.change_muted_state(client_info, mute_button)
+            lambda: self.change_muted_state(client_info, self.mute_button)
         )
-        self.layout.addWidget(self.muted)
-
-        latency_label = QLabel("Latency")
-        latency_label.setToolTip("Latency of the client")
-        self.layout.addWidget(latency_label)
-        latency = QSpinBox(self)
-        latency.setToolTip("Change the latency of the client")
-        latency.setMinimum(-2000)
-        latency.setMaximum(2000)
-        latency.setValue(client_info.get("latency", 0))
-        latency.valueChanged.connect(
-            partial(self.mainwindow.change_latency, client_info["identifier"])
-        )
-        self.layout.addWidget(latency)
+        self.layout.addRow(self.muted)
+
+    def _build_extras(self) -> None:
+        """
+        Builds the version, latency, group and source widgets the first time they are needed.
+        """
+        if self._extras_built:
+            return
+        self._extras_built = True
+        self.logger.debug("Building details section.")
+
+        client_info = self.client_info
+        self.extras_widget = QWidget(self.extras_box)
+        layout = QFormLayout(self.extras_widget)
+        layout.setContentsMargins(0, 0, 0, 0)
+        self.extras_box_layout.addWidget(self.extras_widget)
 
-        group_information_label = QLabel("Group Information:")
-        group_information_label.setToolTip(
-            "Information about the group the client belongs to"
+        self.check_version_button = QPushButton("Check Version")
+        self.check_version_button.setToolTip(_TT_CHECK_VERSION)
+        self.check_version_button.clicked.connect(self.check_version)
+        layout.addRow(
+            self._label("Version", _TT_VERSION),
+            self._row(
+                self._label(client_info.get("version", "Unknown"), _TT_VERSION),
+                self.check_version_button,
+            ),
         )
-        self.layout.addWidget(group_information_label)
 
-        group_label = QLabel("Group Name")
-        group_label.setToolTip("Name of the group the client belongs to")
-        self.layout.addWidget(group_label)
+        self._add_spin_field(layout, *_LATENCY_FIELD)
+
+        layout.addRow(self._label("Group Information:", _TT_GROUP_INFORMATION))
         group_text = client_info.get("group", "Unknown")
-        group = QTextEdit(self)
-        group.setToolTip("Change the group name of the client")
-        group.setText(group_text)
+        self.group = QTextEdit(self)
+        self.group.setToolTip(_TT_CHANGE_GROUP_NAME)
+        self.group.setText(group_text)
         if len(group_text) < 30:
-            group.setFixedHeight(30)
+            self.group.setFixedHeight(30)
         else:
-            group.setFixedHeight(60)
-        group.textChanged.connect(
-            lambda: mainwindow.change_group_name(
-                client_info["identifier"], group.toPlainText()
-            )
-        )
-        self.layout.addWidget(group)
-
-        group_volume_label = QLabel("Group Volume")
-        group_volume_label.setToolTip(
-            "Volume of the group the client belongs to")
-        self.layout.addWidget(group_volume_label)
-
-        group_volume = QSpinBox(self)
-        group_volume.setToolTip(
-            "Change the volume of the group the client belongs to")
-        group_volume.setValue(client_info.get("group_volume", 0))
-        group_volume.setMinimum(0)
-        group_volume.setMaximum(100)
-        group_volume.valueChanged.connect(
-            partial(mainwindow.change_group_volume, client_info["identifier"])
-        )
-        self.layout.addWidget(group_volume)
+            self.group.setFixedHeight(60)
+        self._group_timer = QTimer(self)
+        self._group_timer.setSingleShot(True)
+        self._group_timer.setInterval(250)
+        self._group_timer.timeout.connect(self.apply_group_name_change)
+        self.group.textChanged.connect(self._group_timer.start)
+        layout.addRow(self._label("Group Name", _TT_GROUP_NAME), self.group)
 
-        groups_available_label = QLabel("Groups Available")
-        groups_available_label.setToolTip("Groups available to join")
-        self.layout.addWidget(groups_available_label)
+        self._add_spin_field(layout, *_GROUP_VOLUME_FIELD)
 
-        sources_label = QLabel("Sources")
-        sources_label.setToolTip("Sources available to join")
-        self.layout.addWidget(sources_label)
+        layout.addRow(self._label("Groups Available", _TT_GROUPS_AVAILABLE))
 
         sources_dropdown = QComboBox()
-        for source in sources_dictionary:
-            sources_dropdown.addItem(source)
-        sources_dropdown.setToolTip("Change the source of the client")
-        self.layout.addWidget(sources_dropdown)
+        sources_dropdown.addItems(list(self.sources_dictionary))
+        sources_dropdown.setToolTip(_TT_CHANGE_SOURCE)
+        layout.addRow(self._label("Sources", _TT_SOURCES), sources_dropdown)
+
+    @staticmethod
+    def _label(text: str, tooltip: str) -> QLabel:
+        """
+        Creates a label with the given text and tooltip.
+
+        Args:
+            text: The text of the label.
+            tooltip: The tooltip of the label.
+
+        Returns:
+            The created label.
+        """
+        label = QLabel(text)
+        label.setToolTip(tooltip)
+        return label
+
+    @staticmethod
+    def _row(*widgets: QWidget) -> QWidget:
+        """
+        Packs the given widgets side by side so they can share a single form row.
+
+        Returns:
+            The container widget holding the widgets.
+        """
+        row = QWidget()
+        row_layout = QHBoxLayout(row)
+        row_layout.setContentsMargins(0, 0, 0, 0)
+        for widget in widgets:
+            row_layout.addWidget(widget)
+        return row
+
+    def _add_spin_field(
+        self,
+        layout: QFormLayout,
+        attribute: str,
+        label: str,
+        label_tooltip: str,
+        tooltip: str,
+        key: str,
+        minimum: int,
+        maximum: int,
+        slot_name: str,
+    ) -> QSpinBox:
+        """
+        Adds a labeled spinbox row wired to a MainWindow slot, as described by one of the *_FIELD tuples.
+
+        Returns:
+            The created spinbox, also stored on the dialog under the given attribute name.
+        """
+        spinbox = QSpinBox(self)
+        spinbox.setToolTip(tooltip)
+        spinbox.setRange(minimum, maximum)
+        spinbox.setValue(self.client_info.get(key, 0))
+        spinbox.valueChanged.connect(
+            partial(getattr(self.mainwindow, slot_name), self.client_info["identifier"])
+        )
+        layout.addRow(self._label(label, label_tooltip), spinbox)
+        setattr(self, attribute, spinbox)
+        return spinbox
+
+    def toggle_extras(self, checked: bool) -> None:
+        """
+        Shows or hides the details section, building it on first expansion.
+
+        Args:
+            checked: Whether the details group box has been expanded.
+        """
+        if checked:
+            self._build_extras()
+        if self._extras_built:
+            self.extras_widget.setVisible(checked)
+
+    def apply_name_change(self) -> None:
+        """
+        Sends the client name once typing has paused and mirrors it on the client label.
+        """
+        self.mainwindow.change_client_name(
+            client_uid=self.client_info.get("identifier", "Unknown"),
+            qtextedit=self.name,
+        )
+        self.client_label.setText(self.name.toPlainText())
+
+    def apply_group_name_change(self) -> None:
+        """
+        Sends the group name once typing has paused.
+        """
+        self.mainwindow.change_group_name(
+            self.client_info["identifier"], self.group.toPlainText()
+        )
 
-        self.setLayout(self.layout)
+    def flush_pending_changes(self) -> None:
+        """
+        Sends a client or group rename that is still waiting for its debounce timer.
+        """
+        if self._name_timer.isActive():
+            self._name_timer.stop()
+            self.apply_name_change()
+        if self._extras_built and self._group_timer.isActive():
+            self._group_timer.stop()
+            self.apply_group_name_change()
+
+    def teardown(self) -> None:
+        """
+        Flushes pending renames and disconnects the edit signals. Safe to call more than once.
+        """
+        if self._torn_down:
+            return
+        self._torn_down = True
+        self.logger.debug("Closed.")
+        self.flush_pending_changes()
+        signals = [
+            self.name.textChanged,
+            self.volume_spinbox.valueChanged,
+            self.muted.clicked,
+        ]
+        if self._extras_built:
+            signals += [
+                self.group.textChanged,
+                self.latency_spinbox.valueChanged,
+                self.group_volume_spinbox.valueChanged,
+            ]
+        for signal in signals:
+            try:
+                signal.disconnect()
+            except RuntimeError:
+                pass
+
+    def done(self, result: int) -> None:
+        # accept(), reject() and Esc end here without a closeEvent
+        self.teardown()
+        super().done(result)
 
     def closeEvent(self, event) -> None:
-        self.logger.debug("Closed.")
+        self.teardown()
         event.accept()
 
     def change_muted_state(self, client_info: dict, mute_button: QPushButton) -> None:
@@ -206,40 +345,33 @@ class ClientInfoDialog(QDialog):
         if self.muted.isChecked():
             self.logger.debug("Muted.")
             self.muted.setText("Unmute")
-            mute_button.setIcon(QIcon.fromTheme("audio-volume-muted"))
+            mute_button.setIcon(ClientInfoDialog._muted_icon())
         else:
             self.logger.debug("Unmuted.")
             self.muted.setText("Mute")
-            mute_button.setIcon(QIcon.fromTheme("audio-volume-high"))
+            mute_button.setIcon(ClientInfoDialog._unmuted_icon())
+
+    @classmethod
+    def _muted_icon(cls) -> QIcon:
+        """Returns the muted theme icon, looking it up only on first use."""
+        if cls._ICON_MUTED is None:
+            cls._ICON_MUTED = QIcon.fromTheme("audio-volume-muted")
+        return cls._ICON_MUTED
+
+    @classmethod
+    def _unmuted_icon(cls) -> QIcon:
+        """Returns the unmuted theme icon, looking it up only on first use."""
+        if cls._ICON_UNMUTED is None:
+            cls._ICON_UNMUTED = QIcon.fromTheme("audio-volume-high")
+        return cls._ICON_UNMUTED
 
     def check_version(self):
         self.logger.debug("Checking version.")
         self.check_version_button.setText("Checking...")
-        git_url = QUrl(SnapcastGuiVariables.snapcast_github_url)
-        self.get_latest_version(git_url)
-
-    def get_latest_version(self, git_url: QUrl):
-        if self.network_manager is None:
-            self.network_manager = QNetworkAccessManager(self)
-            self.network_manager.finished.connect(self.on_version_fetched)
-        request = QNetworkRequest(git_url)
-        self.network_manager.get(request)
-
-    @Slot(QNetworkReply)
-    def on_version_fetched(self, reply):
-        if reply.error() == QNetworkReply.NetworkError.NoError:
-            try:
-                data = reply.readAll().data().decode()
-                json_data = json.loads(data)
-                latest_version = json_data.get("tag_name", "")
-                self.latest_version_fetched.emit(latest_version)
-            except Exception as e:
-                self.logger.error(f"Error parsing version data: {str(e)}")
-                self.latest_version_fetched.emit("")
-        else:
-            self.logger.error(f"Network error occurred: {reply.errorString()}")
-            self.latest_version_fetched.emit("")
-        reply.deleteLater()
+        if self.version_checker is None:
+            self.version_checker = SnapcastGuiVariables()
+            self.version_checker.latest_version_fetched.connect(self.on_version_fetched_response)
+        self.version_checker.get_latest_version(SnapcastGuiVariables.snapcast_github_url)
 
     @Slot(str)
     def on_version_fetched_response(self, version):
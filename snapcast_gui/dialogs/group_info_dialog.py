@@ -1,7 +1,6 @@
 import logging
-from functools import partial
 from typing import TYPE_CHECKING
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
 from PySide6.QtGui import QIcon
 from PySide6.QtWidgets import (
     QDialog,
@@ -36,63 +35,49 @@ class GroupInfoDialog(QDialog):
         self.logger = logging.getLogger("GroupInfoDialog")
         self.logger.setLevel(log_level)
 
-        self.logger.debug("Created for client {}.".format(
-            client_info.get("identifier", "Unknown")))
+        identifier_str = client_info.get("identifier", "Unknown")
+        friendly_name = client_info.get("friendly_name", "Unknown")
 
-        self.setWindowTitle(
-            "Group Info for {}".format(
-                client_info.get("friendly_name", "Unknown"))
-        )
-
-        self.layout = QVBoxLayout()
-
-        name_label = QLabel("Name")
-        self.layout.addWidget(name_label)
+        self.mainwindow = mainwindow
+        self.identifier = identifier_str
+        self.sources_dictionary = sources_dictionary
 
-        name = QTextEdit(client_info.get("friendly_name", "Unknown"))
-        name.setToolTip("Group's name")
-        name.setFixedHeight(30)
-        name.textChanged.connect(
-            partial(
-                mainwindow.change_group_name,
-                client_info.get("identifier", "Unknown"),
-                name.toPlainText(),
-            ))
-        self.layout.addWidget(name)
+        self.logger.debug("Created for client {}.".format(identifier_str))
 
-        identifier_label = QLabel("Identifier")
-        self.layout.addWidget(identifier_label)
+        self.setWindowTitle("Group Info for {}".format(friendly_name))
 
-        identifier = QLabel(client_info.get("identifier", "Unknown"))
-        identifier.setToolTip("Group's identifier")
-        self.layout.addWidget(identifier)
+        self.layout = QVBoxLayout(self)
 
-        volume_label = QLabel("Volume")
-        self.layout.addWidget(volume_label)
+        self.name = QTextEdit()
+        self.name.setPlainText(friendly_name)
+        self.name.setFixedHeight(30)
+        self._name_timer = QTimer(self)
+        self._name_timer.setSingleShot(True)
+        self._name_timer.setInterval(250)
+        self._name_timer.timeout.connect(self.apply_name_change)
+        self.name.textChanged.connect(self._name_timer.start)
 
         volume = QSpinBox(self)
-        volume.setToolTip("Change the volume of the client")
-        volume.setValue(client_info.get("volume", 0))
         volume.setMinimum(0)
         volume.setMaximum(100)
-        self.layout.addWidget(volume)
-
-        sources_label = QLabel("Sources")
-        self.layout.addWidget(sources_label)
-
-        sources_dropdown = QComboBox(self)
-        sources_dropdown.setToolTip("Change the source of the group")
-        sources_dropdown.addItems(sources_dictionary.keys())
-        sources_dropdown.currentIndexChanged.connect(
-            partial(
-                mainwindow.change_group_source,
-                client_info.get("identifier", "Unknown"),
-                sources_dictionary.get(
-                    sources_dropdown.currentText(), "Unknown"),
-            ))
-        sources_dropdown.setCurrentText(
-            client_info.get("source_name", "Unknown"))
-        self.layout.addWidget(sources_dropdown)
+        volume.setValue(client_info.get("volume", 0))
+
+        self.sources_dropdown = QComboBox(self)
+        source_names = list(sources_dictionary)
+        self.sources_dropdown.addItems(source_names)
+        source_name = client_info.get("source_name", "Unknown")
+        if source_name in sources_dictionary:
+            self.sources_dropdown.setCurrentIndex(source_names.index(source_name))
+        self.sources_dropdown.currentIndexChanged.connect(self.on_source_changed)
+
+        rows = [
+            ("Name", self.name, "Group's name"),
+            ("Identifier", QLabel(identifier_str), "Group's identifier"),
+            ("Volume", volume, "Change the volume of the client"),
+            ("Sources", self.sources_dropdown, "Change the source of the group"),
+        ]
+        for title, widget, tooltip in rows:
+            self._add_row(title, widget, tooltip)
 
         self.muted = QPushButton("Muted", self)
         self.muted.setCheckable(True)
@@ -104,6 +89,52 @@ class GroupInfoDialog(QDialog):
             self.muted.setChecked(False)
         self.muted.setToolTip("Change the mute state of the client")
 
+    def _add_row(self, title: str, widget: QWidget, tooltip: str) -> None:
+        """
+        Adds a title label followed by the given widget to the layout.
+
+        Args:
+            title: The text of the title label.
+            widget: The widget shown under the title.
+            tooltip: The tooltip of the widget.
+        """
+        self.layout.addWidget(QLabel(title))
+        widget.setToolTip(tooltip)
+        self.layout.addWidget(widget)
+
+    def apply_name_change(self) -> None:
+        """
+        Sends the group name once typing has paused.
+        """
+        self.mainwindow.change_group_name(self.identifier, self.name.toPlainText())
+
+    def on_source_changed(self, index: int) -> None:
+        """
+        Sends the stream picked in the sources dropdown.
+
+        Args:
+            index: The index of the selected source.
+        """
+        self.mainwindow.change_group_source(
+            self.identifier,
+            self.sources_dictionary.get(
+                self.sources_dropdown.itemText(index), "Unknown"),
+        )
+
+    def flush_pending_changes(self) -> None:
+        """
+        Sends a group rename that is still waiting for its debounce timer.
+        """
+        if self._name_timer.isActive():
+            self._name_timer.stop()
+            self.apply_name_change()
+
+    def done(self, result: int) -> None:
+        # accept(), reject() and Esc end here without a closeEvent
+        self.flush_pending_changes()
+        super().done(result)
+
     def closeEvent(self, event) -> None:
         self.logger.debug("Closed.")
+        self.flush_pending_changes()
         event.accept()
\ No newline at end of file
@@ -1,4 +1,5 @@
 import logging
+from typing import TYPE_CHECKING
 
 from PySide6.QtWidgets import (
     QDialog,
@@ -10,7 +11,9 @@ from PySide6.QtWidgets import (
     QVBoxLayout,
     QCheckBox,
 )
-from snapcast_gui.fileactions.snapcast_settings import SnapcastSettings
+
+if TYPE_CHECKING:
+    from snapcast_gui.fileactions.snapcast_settings import SnapcastSettings
 
 
 class PathInputDialog(QDialog):
@@ -23,11 +26,14 @@ class PathInputDialog(QDialog):
     accepting or rejecting the input.
     """
 
-    def __init__(self, program_name: str, log_level: int):
+    def __init__(self, program_name: str, snapcast_settings: "SnapcastSettings", log_level: int):
         super().__init__()
         self.logger = logging.getLogger("PathInputDialog")
         self.logger.setLevel(log_level)
-        self.logger.debug(f"Initializing for {program_name}")
+        self.logger.debug("Initializing for %s", program_name)
+
+        self.snapcast_settings = snapcast_settings
+        self.program_name = program_name.removesuffix(".exe")
 
         self.setWindowTitle(f"Provide path for {program_name}")
 
@@ -73,18 +79,20 @@ class PathInputDialog(QDialog):
         Returns:
             str: The path entered by the user in the path_edit field.
         """
-        self.logger.debug(f"Returning path: {self.path_edit.text()}")
-        return self.path_edit.text()
+        path = self.path_edit.text()
+        self.logger.debug("Returning path: %s", path)
+        return path
 
     def accept(self) -> None:
         """
         Accepts the dialog and stores the user's preference for ignoring the popup.
 
         This method is triggered when the OK button is clicked. It stores the user's
-        preference for ignoring the popup in the settings file using the SnapcastSettings
-        class and then accepts the dialog.
+        preference for ignoring the popup in the settings file using the shared
+        SnapcastSettings instance and then accepts the dialog.
         """
         ignore_popup = self.ignore_popup_checkbox.isChecked()
-        SnapcastSettings().set_ignore_popup(ignore_popup)
-        self.logger.debug(f"Ignore popup preference set to: {ignore_popup}")
+        self.snapcast_settings.update_setting(
+            "{}/ignore_popup".format(self.program_name), ignore_popup)
+        self.logger.debug("Ignore popup preference set to: %s", ignore_popup)
         super().accept()
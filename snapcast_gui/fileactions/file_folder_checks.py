@@ -4,6 +4,12 @@ import os
 from snapcast_gui.misc.notifications import Notifications
 from snapcast_gui.misc.snapcast_gui_variables import SnapcastGuiVariables
 
+_CHMOD_TARGETS = (
+    (SnapcastGuiVariables.log_file_path, 0o644),
+    (SnapcastGuiVariables.log_level_file_path, 0o644),
+    (SnapcastGuiVariables.settings_file_path, 0o644),
+)
+
 
 class FileFolderChecks:
     @staticmethod
@@ -42,27 +48,27 @@ class FileFolderChecks:
             SnapcastGuiVariables.config_file_path,
             SnapcastGuiVariables.log_level_file_path,
         ]
+        try:
+            with os.scandir(SnapcastGuiVariables.config_dir) as entries:
+                present = {entry.name for entry in entries}
+        except (FileNotFoundError, NotADirectoryError):
+            present = set()
         missing_files = [
-            file for file in required_files if not os.path.exists(file)]
-        if missing_files:
-            for file in missing_files:
-                os.makedirs(os.path.dirname(file), exist_ok=True)
-                try:
-                    with open(file, "w") as f:
-                        f.write("")
-                        print(
-                            "snapcastsettings: Created missing file: {}".format(
-                                file)
-                        )
-                except IsADirectoryError:
-                    os.removedirs(os.path.dirname(file))
-                    logging.error(
-                        "snapcastsettings: File path is a directory: {}. Removing directory".format(
-                            file
-                        )
-                    )
+            file for file in required_files if os.path.basename(file) not in present]
+        for parent in {os.path.dirname(file) for file in missing_files}:
+            os.makedirs(parent, exist_ok=True)
+        for file in missing_files:
+            try:
+                open(file, "w").close()
                 print(
                     "snapcastsettings: Created missing file: {}".format(file))
+            except IsADirectoryError:
+                os.removedirs(os.path.dirname(file))
+                logging.error(
+                    "snapcastsettings: File path is a directory: {}. Removing directory".format(
+                        file
+                    )
+                )
 
     @staticmethod
     def set_file_permission() -> None:
@@ -70,9 +76,8 @@ class FileFolderChecks:
         Sets the permissions for application files.
         """
         try:
-            os.chmod(SnapcastGuiVariables.log_file_path, 0o644)
-            os.chmod(SnapcastGuiVariables.log_level_file_path, 0o644)
-            os.chmod(SnapcastGuiVariables.settings_file_path, 0o644)
+            for path, mode in _CHMOD_TARGETS:
+                os.chmod(path, mode)
         except PermissionError:
             Notifications.send_notify(
                 "Error", "Permission denied to set file permissions.")
@@ -5,21 +5,44 @@ from PySide6.QtCore import QSettings
 
 from snapcast_gui.misc.snapcast_gui_variables import SnapcastGuiVariables
 
+_DEFAULT_SETTINGS = {
+    "general/auto_connect": False,
+    "themes/current_theme": "",
+    "snapclient/autostart": False,
+    "snapclient/show_advanced_settings_on_startup": False,
+    "snapclient/enable_custom_path": False,
+    "snapclient/custom_path": "",
+    "snapclient/ignore_popup": False,
+    "snapserver/autostart": False,
+    "snapserver/enable_custom_path": False,
+    "snapserver/custom_path": "",
+    "snapserver/config_before_start": "",
+    "snapserver/config_after_start": "",
+    "snapserver/ignore_popup": True,
+    "shortcuts/open_settings": "Ctrl+O",
+    "shortcuts/connect_disconnect": "Ctrl+C",
+    "shortcuts/toggle_snapclient": "Ctrl+E",
+    "shortcuts/toggle_snapserver": "Ctrl+R",
+    "shortcuts/quit": "Ctrl+Q",
+    "shortcuts/hide": "Ctrl+H",
+}
+
 
 class SnapcastSettings:
     """
     A class that handles the settings for the Snapcast GUI application.
     """
 
-    def __init__(self, log_level: int = logging.DEBUG) -> None:
+    def __init__(self) -> None:
         """
         Initializes the snapcastsettings object.
-
-        Args:
-            log_level: The log level to set for the application.
         """
         self.logger = logging.getLogger("SnapcastSettings")
-        self.logger.setLevel(log_level)
+
+        self._settings = QSettings(
+            SnapcastGuiVariables.settings_file_path, QSettings.IniFormat)
+        self._config = QSettings(
+            SnapcastGuiVariables.config_file_path, QSettings.IniFormat)
 
         self.ensure_settings()
 
@@ -27,32 +50,22 @@ class SnapcastSettings:
         """
         Ensures that all settings are present in the settings file and have default values.
         """
-        default_settings = {
-            "general/auto_connect": False,
-            "themes/current_theme": "",
-            "snapclient/autostart": False,
-            "snapclient/show_advanced_settings_on_startup": False,
-            "snapclient/enable_custom_path": False,
-            "snapclient/custom_path": "",
-            "snapclient/ignore_popup": False,
-            "snapserver/autostart": False,
-            "snapserver/config_before_start": "",
-            "snapserver/config_after_start": "",
-            "snapserver/ignore_popup": True,
-            "shortcuts/open_settings": "Ctrl+O",
-            "shortcuts/connect_disconnect": "Ctrl+C",
-            "shortcuts/toggle_snapclient": "Ctrl+E",
-            "shortcuts/toggle_snapserver": "Ctrl+R",
-            "shortcuts/quit": "Ctrl+Q",
-            "shortcuts/hide": "Ctrl+H",
-        }
-
-        settings = QSettings(
-            SnapcastGuiVariables.settings_file_path, QSettings.IniFormat)
-        for key, value in default_settings.items():
-            if not settings.contains(key):
-                settings.setValue(key, value)
-        settings.sync()
+        existing = set(self._settings.allKeys())
+        missing = [key for key in _DEFAULT_SETTINGS if key not in existing]
+        if not missing:
+            return
+        for key in missing:
+            self._settings.setValue(key, _DEFAULT_SETTINGS[key])
+        self.logger.debug("Added default settings: %s", missing)
+
+    def sync(self) -> None:
+        """
+        Writes pending changes of the settings and config files to disk.
+
+        QSettings flushes on its own from the event loop, so this is only needed on shutdown.
+        """
+        self._settings.sync()
+        self._config.sync()
 
     def update_setting(self, key: str, value: str) -> None:
         """
@@ -62,36 +75,52 @@ class SnapcastSettings:
             key: The key of the setting to update.
             value: The new value for the setting.
         """
-        settings = QSettings(
-            SnapcastGuiVariables.settings_file_path, QSettings.IniFormat)
-        settings.setValue(key, value)
-        settings.sync()
-        self.logger.debug("Updated setting: {} = {}".format(key, value))
+        self._settings.setValue(key, value)
+        self.logger.debug("Updated setting: %s = %s", key, value)
 
-    def read_setting(self, setting_name: str) -> str:
+    def read_setting(self, setting_name: str, default=None, value_type=None):
         """
         Reads a setting from the settings file with the given setting_name and returns its value.
 
+        Args:
+            setting_name: The key of the setting to read.
+            default: The value returned if the setting is missing. Defaults to the
+                setting's entry in the default settings, or "" for unknown settings.
+            value_type: The type Qt converts the stored value to. Defaults to bool for
+                settings whose default is a bool.
+
         Returns:
             The value of the setting.
         """
-        settings = QSettings(
-            SnapcastGuiVariables.settings_file_path, QSettings.IniFormat)
-        value = settings.value(setting_name)
-        if value is None:
-            value = ""
-        if isinstance(value, str):
-            if value.lower() == "true":
-                value = True
-            elif value.lower() == "false":
-                value = False
-        self.logger.debug(
-            "Read setting: {} = {}, type {}".format(
-                setting_name, value, type(value)
-            )
-        )
+        if default is None:
+            default = _DEFAULT_SETTINGS.get(setting_name, "")
+        if value_type is None and isinstance(default, bool):
+            value_type = bool
+        if value_type is None:
+            value = self._settings.value(setting_name, default)
+        else:
+            value = self._settings.value(setting_name, default, type=value_type)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "Read setting: %s = %s, type %s", setting_name, value, type(value))
         return value
 
+    def read_settings_group(self, group: str) -> dict:
+        """
+        Reads every setting directly inside the given group in one pass.
+
+        Args:
+            group: The name of the group to read.
+
+        Returns:
+            A dict mapping the setting names, without the group prefix, to their values.
+        """
+        self._settings.beginGroup(group)
+        try:
+            return {key: self._settings.value(key) for key in self._settings.childKeys()}
+        finally:
+            self._settings.endGroup()
+
     def read_config_file(self) -> list[str]:
         """
         Reads the config file and returns the list of IP addresses.
@@ -105,29 +134,50 @@ class SnapcastSettings:
         """
         ip_addresses = []
         try:
-            with open(SnapcastGuiVariables.config_file_path, "r") as f:
-                f.close()
-            settings = QSettings(
-                SnapcastGuiVariables.config_file_path, QSettings.IniFormat)
-            ip_addresses = settings.value("server/ip_addresses").split(",")
-            for ip_address in ip_addresses:
-                if ip_address == "":
-                    ip_addresses.remove(ip_address)
-            self.logger.debug("Read config file: {}".format(ip_addresses))
+            if os.path.isdir(SnapcastGuiVariables.config_file_path):
+                raise IsADirectoryError(SnapcastGuiVariables.config_file_path)
+            self._config.beginGroup("server")
+            try:
+                ip_addresses = self._ip_addresses([])
+            finally:
+                self._config.endGroup()
+            self.logger.debug("Read config file: %s", ip_addresses)
             return ip_addresses
         except IsADirectoryError:
             os.removedirs(os.path.dirname(
                 SnapcastGuiVariables.config_file_path))
             self.logger.error(
-                "File path is a directory: {}. Removing directory".format(
-                    SnapcastGuiVariables.config_file_path
-                )
+                "File path is a directory: %s. Removing directory",
+                SnapcastGuiVariables.config_file_path,
             )
             return []
         except Exception as e:
-            self.logger.error("Error reading config file: {}".format(e))
+            self.logger.error("Error reading config file: %s", e)
             return []
 
+    def _ip_addresses(self, default: list[str]) -> list[str]:
+        """
+        Reads the IP address list from the current config group, dropping empty entries.
+
+        The list is stored natively by QSettings. Older config files hold it as a single
+        comma separated string, which is split here and rewritten as a list on the next change.
+
+        Args:
+            default: The list returned if the ip_addresses key has never been written.
+
+        Returns:
+            A list of IP addresses.
+        """
+        if not self._config.contains("ip_addresses"):
+            return list(default)
+        value = self._config.value("ip_addresses")
+        # An empty list is stored as @Invalid() and reads back as None
+        if value is None:
+            return []
+        if isinstance(value, str):
+            value = value.split(",")
+        return [ip_address for ip_address in value if ip_address.strip()]
+
     def add_ip(self, ip: str) -> None:
         """
         Adds an IP address to the config file.
@@ -136,21 +186,20 @@ class SnapcastSettings:
             ip: The IP address to add.
         """
         try:
-            settings = QSettings(
-                SnapcastGuiVariables.config_file_path, QSettings.IniFormat)
-            ip_addresses = settings.value(
-                "server/ip_addresses", "localhost").split(",")
-            ip_addresses.append(ip)
-            settings.setValue("server/ip_addresses", ",".join(ip_addresses))
-            settings.sync()
+            self._config.beginGroup("server")
+            try:
+                ip_addresses = dict.fromkeys(self._ip_addresses(["localhost"]))
+                if ip in ip_addresses:
+                    self.logger.debug("IP Address %s already in config file.", ip)
+                    return
+                ip_addresses[ip] = None
+                self._config.setValue("ip_addresses", list(ip_addresses))
+            finally:
+                self._config.endGroup()
         except Exception as e:
-            self.logger.error(
-                f"Could not add IP Address to config file: {str(e)}"
-            )
+            self.logger.error("Could not add IP Address to config file: %s", e)
             return
-        self.logger.debug(
-            "IP Address {} added to config file.".format(ip)
-        )
+        self.logger.debug("IP Address %s added to config file.", ip)
 
     def remove_ip(self, ip: str) -> None:
         """
@@ -160,18 +209,17 @@ class SnapcastSettings:
             ip: The IP address to remove.
         """
         try:
-            settings = QSettings(
-                SnapcastGuiVariables.config_file_path, QSettings.IniFormat)
-            ip_addresses = settings.value(
-                "server/ip_addresses", "localhost").split(",")
-            ip_addresses.remove(ip)
-            settings.setValue("server/ip_addresses", ",".join(ip_addresses))
-            settings.sync()
+            self._config.beginGroup("server")
+            try:
+                ip_addresses = dict.fromkeys(self._ip_addresses(["localhost"]))
+                if ip not in ip_addresses:
+                    self.logger.warning("IP Address %s not in config file.", ip)
+                    return
+                del ip_addresses[ip]
+                self._config.setValue("ip_addresses", list(ip_addresses))
+            finally:
+                self._config.endGroup()
         except Exception as e:
-            self.logger.error(
-                f"Could not remove IP Address from config file: {str(e)}"
-            )
+            self.logger.error("Could not remove IP Address from config file: %s", e)
             return
-        self.logger.debug(
-            "IP Address {} removed from config file.".format(ip)
-        )
+        self.logger.debug("IP Address %s removed from config file.", ip)
@@ -2,6 +2,8 @@ import logging
 
 
 class LoggerSetup:
+    _configured = False
+
     @staticmethod
     def setup_logging(log_file_path: str, log_level: int):
         """
@@ -11,8 +13,8 @@ class LoggerSetup:
             log_file_path (str): The path to the log file.
             log_level (int): The logging level.
         """
-        # Check if handlers are already added to avoid duplicate logs
-        if not logging.getLogger().hasHandlers():
+        # Only add the handlers once to avoid duplicate logs
+        if not LoggerSetup._configured:
             file_handler = logging.FileHandler(log_file_path)
             stdout_handler = logging.StreamHandler()
 
@@ -29,6 +31,7 @@ class LoggerSetup:
 
             logging.getLogger().addHandler(file_handler)
             logging.getLogger().addHandler(stdout_handler)
+            LoggerSetup._configured = True
 
         logging.getLogger().setLevel(log_level)
 
@@ -1,34 +1,69 @@
 import logging
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 from snapcast_gui.misc.snapcast_gui_variables import SnapcastGuiVariables
 
-from notifypy import Notify
+# A single worker keeps notifications in order and lets them share one Notify object.
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="Notifications")
+_ICON = (
+    SnapcastGuiVariables.snapcast_icon_path
+    if sys.platform.startswith(("linux", "win"))
+    else None
+)
 
 class Notifications:
     """
     Class for sending notifications.
     """
     logger = logging.getLogger("Notifications")
-    logger.setLevel(logging.INFO)
+
+    _notifier = None
+    _notifier_unavailable = False
 
     @staticmethod
     def send_notify(title: str, message: str) -> None:
         """
-        Sends a notification with the specified title and message. Handles the icon based on the platform.
+        Sends a notification with the specified title and message.
+        The notification is delivered on a worker thread so the caller is not blocked.
+        """
+        if Notifications._notifier_unavailable:
+            return
+
+        Notifications.logger.info("Sending notification: {}".format(message))
+        _executor.submit(Notifications._send, title, message)
+
+    @staticmethod
+    def _send(title: str, message: str) -> None:
+        """
+        Fills in the shared notification and sends it. Only runs on the notification worker.
         """
         try:
-            notification = Notify()
-            notification.application_name = "Snapcast-Gui"
-            notification.title = title
-            notification.message = message
+            notifier = Notifications._get_notifier()
+            if notifier is None:
+                return
+            notifier.title = title
+            notifier.message = message
+            notifier.send()
         except Exception as e:
-            Notifications.logger.error("Platform not supported: {} {}".format(sys.platform, e))
+            # Nothing reads the worker's futures, so errors have to be logged here
+            Notifications.logger.error("Could not send notification: {}".format(e))
 
-        Notifications.logger.info("Sending notification: {}".format(message))
+    @staticmethod
+    def _get_notifier():
+        """
+        Returns the shared Notify object, importing notifypy and building it on first use.
+        Returns None if notifications are not supported on this platform.
+        """
+        if Notifications._notifier is None and not Notifications._notifier_unavailable:
+            try:
+                from notifypy import Notify
 
-        if sys.platform.startswith("linux") or sys.platform.startswith("win"):
-            notification.icon = SnapcastGuiVariables.snapcast_icon_path
-        elif sys.platform.startswith("darwin"):
-            notification.icon = None
-        notification.send()
\ No newline at end of file
+                notifier = Notify()
+                notifier.application_name = "Snapcast-Gui"
+                notifier.icon = _ICON
+                Notifications._notifier = notifier
+            except Exception as e:
+                Notifications._notifier_unavailable = True
+                Notifications.logger.error("Platform not supported: {} {}".format(sys.platform, e))
+        return Notifications._notifier
@@ -1,11 +1,14 @@
 import json
-from PySide6.QtCore import QUrl, QObject, Signal, Slot
-from PySide6.QtNetwork import QNetworkAccessManager, QNetworkRequest
+import logging
+import re
+from PySide6.QtCore import QUrl, QObject, Signal
 from PySide6.QtCore import QStandardPaths
 from pathlib import Path
 import sys
 import os
 
+_TAG_NAME_RE = re.compile(rb'"tag_name"\s*:\s*"([^"\\]+)"')
+
 
 class SnapcastGuiVariables(QObject):
     """
@@ -30,77 +33,124 @@ class SnapcastGuiVariables(QObject):
         "https://api.github.com/repos/chicco-carone/Snapcast-Gui/releases/latest")
     snapcast_gui_version = "0.1.1"
 
-    config_dir: str = str(Path(QStandardPaths.writableLocation(
-        QStandardPaths.AppConfigLocation)) / "snapcast-gui")
-    log_file_path: str = str(Path(config_dir) / "snapcast-gui.log")
-    settings_file_path: str = str(Path(config_dir) / "settings.ini")
-    config_file_path: str = str(Path(config_dir) / "config.ini")
-    log_level_file_path: str = str(Path(config_dir) / "log_level.txt")
+    _config_path = Path(QStandardPaths.writableLocation(
+        QStandardPaths.AppConfigLocation)) / "snapcast-gui"
+    config_dir: str = str(_config_path)
+    log_file_path: str = str(_config_path / "snapcast-gui.log")
+    settings_file_path: str = str(_config_path / "settings.ini")
+    config_file_path: str = str(_config_path / "config.ini")
+    log_level_file_path: str = str(_config_path / "log_level.txt")
 
     snapcast_icon_path: str = ""
     github_icon_path: str = ""
 
     latest_version_fetched = Signal(str)
 
-    def __init__(self):
-        super().__init__()
-        self.network_manager = QNetworkAccessManager()
-        self.network_manager.finished.connect(self.on_version_fetched)
+    logger = logging.getLogger("SnapcastGuiVariables")
+
+    _shared_network_manager = None
+    # GitHub API url -> (ETag, tag_name) of the last successful release lookup
+    _release_cache = {}
 
-        SnapcastGuiVariables.initialize_icons()
+    @classmethod
+    def _network_manager(cls):
+        """Returns the network manager shared by every version check, creating it on first use."""
+        if cls._shared_network_manager is None:
+            # QtNetwork is only needed for version checks, so the command line paths don't load it
+            from PySide6.QtNetwork import QNetworkAccessManager
+
+            cls._shared_network_manager = QNetworkAccessManager()
+        return cls._shared_network_manager
 
     @staticmethod
     def initialize_icons():
         """Initialize the paths for icon files, considering different environments."""
-
-        snapcast_icon_system = "/usr/share/icons/hicolor/256x256/apps/snapcast-gui.png"
-        github_icon_system = "/usr/share/icons/hicolor/256x256/apps/github.png"
-
-        if os.path.exists(snapcast_icon_system):
-            SnapcastGuiVariables.snapcast_icon_path = snapcast_icon_system
+        if SnapcastGuiVariables.snapcast_icon_path:
+            return
+
+        system_icons_dir = "/usr/share/icons/hicolor/256x256/apps"
+        try:
+            system_icons = set(os.listdir(system_icons_dir))
+        except OSError:
+            system_icons = set()
+
+        if "snapcast-gui.png" in system_icons:
+            SnapcastGuiVariables.snapcast_icon_path = os.path.join(
+                system_icons_dir, "snapcast-gui.png")
         else:
             SnapcastGuiVariables.snapcast_icon_path = SnapcastGuiVariables.resource_path(
                 "icons/Snapcast.png")
 
-        if os.path.exists(github_icon_system):
-            SnapcastGuiVariables.github_icon_path = github_icon_system
+        if "github.png" in system_icons:
+            SnapcastGuiVariables.github_icon_path = os.path.join(
+                system_icons_dir, "github.png")
         else:
             SnapcastGuiVariables.github_icon_path = SnapcastGuiVariables.resource_path(
                 "icons/Github.png")
 
-    @staticmethod
-    def get_latest_version(git_url: QUrl):
+    def get_latest_version(self, git_url: QUrl):
         """
         Get the latest version from the provided GitHub URL.
+        The result is emitted through latest_version_fetched.
+
+        A release fetched before is revalidated with its ETag, so an unchanged release is answered
+        with a 304 from the cache instead of being downloaded and parsed again.
 
         Parameters:
         - git_url: A QUrl object representing the GitHub API URL to fetch the latest release.
         """
-        network_manager = QNetworkAccessManager()
+        from PySide6.QtNetwork import QNetworkRequest
+
         request = QNetworkRequest(git_url)
-        network_manager.get(request)
+        cached = SnapcastGuiVariables._release_cache.get(git_url.toString())
+        if cached is not None:
+            request.setRawHeader(b"If-None-Match", cached[0])
+        reply = SnapcastGuiVariables._network_manager().get(request)
+        reply.finished.connect(lambda: self.on_version_fetched(reply))
 
-    @Slot("QNetworkReply*")
     def on_version_fetched(self, reply):
         """
-        Slot to handle the finished signal of the network request.
+        Handles the reply of a release lookup started by get_latest_version.
 
         Parameters:
         - reply: QNetworkReply object with the result of the HTTP request.
         """
-        if reply.error() == reply.NoError:
-            try:
-                data = reply.readAll().data().decode()
-                json_data = json.loads(data)
-                latest_version = json_data.get("tag_name", "")
-                self.latest_version_fetched.emit(latest_version)
-            except Exception as e:
-                self.latest_version_fetched.emit("")
+        from PySide6.QtNetwork import QNetworkReply, QNetworkRequest
+
+        latest_version = ""
+        if reply.error() == QNetworkReply.NetworkError.NoError:
+            url = reply.url().toString()
+            status = reply.attribute(QNetworkRequest.HttpStatusCodeAttribute)
+            if status == 304 and url in SnapcastGuiVariables._release_cache:
+                SnapcastGuiVariables.logger.debug("Release unchanged, using cached version.")
+                latest_version = SnapcastGuiVariables._release_cache[url][1]
+            else:
+                try:
+                    latest_version = SnapcastGuiVariables.parse_release_tag(bytes(reply.readAll()))
+                except Exception as e:
+                    SnapcastGuiVariables.logger.error(f"Error parsing version data: {str(e)}")
+                etag = bytes(reply.rawHeader(b"ETag"))
+                if etag and latest_version:
+                    SnapcastGuiVariables._release_cache[url] = (etag, latest_version)
         else:
-            self.latest_version_fetched.emit("")
+            SnapcastGuiVariables.logger.error(f"Network error occurred: {reply.errorString()}")
 
+        self.latest_version_fetched.emit(latest_version)
         reply.deleteLater()
 
+    @staticmethod
+    def parse_release_tag(data: bytes) -> str:
+        """
+        Extracts the tag_name from a GitHub release JSON payload.
+
+        The field is picked out with a regex so the whole payload doesn't have to be parsed,
+        falling back to json for anything the regex doesn't match.
+        """
+        match = _TAG_NAME_RE.search(data)
+        if match:
+            return match.group(1).decode()
+        return json.loads(data).get("tag_name", "")
+
     @staticmethod
     def resource_path(relative_path: str) -> str:
         """Gets the path to the resource, considering the PyInstaller bundle."""
@@ -1,5 +1,8 @@
+from __future__ import annotations
+
 import logging
 import sys
+from functools import lru_cache
 
 from snapcast_gui.misc.snapcast_gui_variables import SnapcastGuiVariables
 
@@ -16,6 +19,15 @@ if TYPE_CHECKING:
     from snapcast_gui.windows.combined_window import CombinedWindow
     from snapcast_gui.fileactions.snapcast_settings import SnapcastSettings
 
+_SNAPSERVER_SUPPORTED = sys.platform in ("linux", "darwin")
+_IS_WINDOWS = sys.platform == "win32"
+
+
+@lru_cache(maxsize=32)
+def _key_sequence(binding: str) -> QKeySequence:
+    """Parses a shortcut binding once and reuses the result on later loads."""
+    return QKeySequence(binding)
+
 
 class TrayIcon(QSystemTrayIcon):
     """
@@ -24,12 +36,12 @@ class TrayIcon(QSystemTrayIcon):
 
     def __init__(
         self,
-        main_window: 'MainWindow',
-        client_window: 'ClientWindow',
-        server_window: 'ServerWindow',
-        settings_window: 'SettingsWindow',
-        combined_window: 'CombinedWindow',
-        snapcast_settings: 'SnapcastSettings',
+        main_window: MainWindow,
+        client_window: ClientWindow,
+        server_window: ServerWindow,
+        settings_window: SettingsWindow,
+        combined_window: CombinedWindow,
+        snapcast_settings: SnapcastSettings,
         log_level: int,
     ):
         """
@@ -74,10 +86,10 @@ class TrayIcon(QSystemTrayIcon):
         self.toggle_snapclient_action = self.menu.addAction("Start Snapclient")
         self.toggle_snapclient_action.triggered.connect(self.toggle_snapclient)
 
-        if sys.platform == "linux" or sys.platform == "darwin":
+        if _SNAPSERVER_SUPPORTED:
             self.toggle_snapserver_action = self.menu.addAction("Start Snapserver")
             self.toggle_snapserver_action.triggered.connect(self.toggle_snapserver)
-        elif sys.platform == "win32":
+        elif _IS_WINDOWS:
             self.toggle_snapserver_action = self.menu.addAction(
                 "Start Snapserver (Unsupported)"
             )
@@ -149,57 +161,39 @@ class TrayIcon(QSystemTrayIcon):
 
         It reads the shortcuts from the settings file and creates QShortcut objects for each action.
 
-        Shortcut actions are connected to their respective functions and logging statements are added
-        to indicate when each shortcut is activated.
+        Shortcut actions are connected to their respective functions and to a shared slot that logs
+        when each shortcut is activated. Shortcuts without a binding are skipped, and reloading
+        replaces the shortcuts created by the previous call.
         """
         self.logger.debug("Loading shortcuts")
-        self.settings_shortcut = QShortcut(
-            QKeySequence(
-                self.snapcast_settings.read_setting("Shortcuts/Open_Settings")
-            ),
-            self.combined_window,
-        )
-        self.settings_shortcut.activated.connect(
-            self.combined_window.toggle_settings_window
-        )
-        self.settings_shortcut.activated.connect(
-            lambda: self.logger.debug("Open settings shortcut activated")
-        )
-        self.snapserver_shortcut = QShortcut(
-            QKeySequence(
-                self.snapcast_settings.read_setting("Shortcuts/Toggle_Snapserver")
-            ),
-            self.combined_window,
-        )
-        self.snapserver_shortcut.activated.connect(
-            self.combined_window.toggle_server_window
-        )
-        self.snapserver_shortcut.activated.connect(
-            lambda: self.logger.debug("Toggle Snapserver shortcut activated")
-        )
-        self.snapclient_shortcut = QShortcut(
-            QKeySequence(
-                self.snapcast_settings.read_setting("Shortcuts/Toggle_Snapclient")
-            ),
-            self.combined_window,
-        )
-        self.snapclient_shortcut.activated.connect(self.client_window.toggle_snapclient)
-        self.snapclient_shortcut.activated.connect(
-            lambda: self.logger.debug("Toggle Snapclient shortcut activated")
-        )
-        self.quit_shortcut = QShortcut(
-            QKeySequence(self.snapcast_settings.read_setting("Shortcuts/Quit")),
-            self.combined_window,
-        )
-        self.quit_shortcut.activated.connect(QApplication.quit)
-        self.quit_shortcut.activated.connect(
-            lambda: self.logger.debug("Quit shortcut activated")
-        )
-        self.hide_shortcut = QShortcut(
-            QKeySequence(self.snapcast_settings.read_setting("Shortcuts/Hide")),
-            self.combined_window,
-        )
-        self.hide_shortcut.activated.connect(self.combined_window.hide)
-        self.hide_shortcut.activated.connect(
-            lambda: self.logger.debug("Hide shortcut activated")
-        )
+        # The defaults are stored as e.g. "open_settings" while the settings window saves
+        # "Open_Settings", so keys are matched case-insensitively, preferring the saved spelling.
+        shortcuts = {}
+        for key, value in self.snapcast_settings.read_settings_group("shortcuts").items():
+            if key.lower() not in shortcuts or key != key.lower():
+                shortcuts[key.lower()] = value
+        for attribute, key, slot in (
+            ("settings_shortcut", "open_settings", self.combined_window.toggle_settings_window),
+            ("snapserver_shortcut", "toggle_snapserver", self.combined_window.toggle_server_window),
+            ("snapclient_shortcut", "toggle_snapclient", self.client_window.toggle_snapclient),
+            ("quit_shortcut", "quit", QApplication.quit),
+            ("hide_shortcut", "hide", self.combined_window.hide),
+        ):
+            previous = getattr(self, attribute, None)
+            if previous is not None:
+                previous.setParent(None)
+                previous.deleteLater()
+            binding = shortcuts.get(key)
+            if not binding:
+                setattr(self, attribute, None)
+                continue
+            shortcut = QShortcut(_key_sequence(binding), self.combined_window)
+            shortcut.activated.connect(slot)
+            shortcut.activated.connect(self.log_shortcut_activated)
+            setattr(self, attribute, shortcut)
+
+    def log_shortcut_activated(self) -> None:
+        """
+        Logs which shortcut was activated. Shared by all the shortcuts created in load_shortcuts.
+        """
+        self.logger.debug("Shortcut activated: %s", self.sender().key().toString())
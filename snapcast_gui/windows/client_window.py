@@ -37,6 +37,7 @@ class ClientWindow(QMainWindow):
         self.audio_engine = "alsa"
         self.buffer_size = "20"
         self.snapclient_process = None
+        self.pcms_process = None
         self.cleanup_connected = False
         self.snapclient_finished_signal = None
 
@@ -185,33 +186,69 @@ class ClientWindow(QMainWindow):
             self.logger.info("Audio engine set to PulseAudio")
             self.pcms_dropdown.clear()
             self.pcms_dropdown.setEnabled(True)
-            self.pcms_refresh_button.setEnabled(True)
+            self.pcms_refresh_button.setEnabled(False)
+            if (
+                self.pcms_process is not None
+                and self.pcms_process.state() != QProcess.NotRunning
+            ):
+                return
 
-            self.snapclient_process = QProcess()
-            self.snapclient_process.setProgram("snapclient")
-            self.snapclient_process.setArguments(["--list"])
-            self.snapclient_process.setProcessChannelMode(QProcess.MergedChannels)
-            self.snapclient_process.readyReadStandardOutput.connect(
-                self.read_snapclient_output
-            )
-            self.snapclient_process.start()
+            self.pcms_process = QProcess(self)
+            self.pcms_process.setProgram("snapclient")
+            self.pcms_process.setArguments(["--list"])
+            self.pcms_process.setProcessChannelMode(QProcess.MergedChannels)
+            self.pcms_process.finished.connect(self.on_pcms_listed)
+            self.pcms_process.errorOccurred.connect(self.on_pcms_list_error)
+            self.pcms_process.start()
             self.logger.info("Snapclient process started to get PCMs")
-            self.snapclient_process.waitForFinished()
         else:
             self.pcms_dropdown.clear()
             self.pcms_dropdown.addItem("Switch to PulseAudio to see PCMs")
             self.pcms_dropdown.setEnabled(False)
 
+    def on_pcms_listed(self) -> None:
+        """
+        Called when `snapclient --list` exits. Populates the PCMs dropdown and re-enables the refresh button.
+        """
+        if self.audio_engine == "pulse":
+            self.read_snapclient_output()
+        self.restore_pcms_refresh_button()
+        self.pcms_process.deleteLater()
+        self.pcms_process = None
+
+    def on_pcms_list_error(self, error: QProcess.ProcessError) -> None:
+        """
+        Re-enables the refresh button if `snapclient --list` could not be started, since it won't emit finished.
+        """
+        if error == QProcess.FailedToStart:
+            self.logger.error("Could not start snapclient to get PCMs")
+            self.restore_pcms_refresh_button()
+            self.pcms_process.deleteLater()
+            self.pcms_process = None
+
+    def restore_pcms_refresh_button(self) -> None:
+        """
+        Re-enables the PCMs refresh button after a listing, unless PulseAudio is no longer selected
+        or the controls were disabled because snapclient is running.
+        """
+        snapclient_running = (
+            self.snapclient_process is not None
+            and self.snapclient_process.state() != QProcess.NotRunning
+        )
+        self.pcms_refresh_button.setEnabled(
+            self.audio_engine == "pulse" and not snapclient_running)
+
     def read_snapclient_output(self) -> List[str]:
         """
         Reads the output of the snapclient process to get the PCMs to populate the PCMs dropdown.
         """
         self.logger.debug("Reading snapclient output")
-        if self.snapclient_process is not None:
-            output = self.snapclient_process.readAllStandardOutput().data().decode()
+        device_names: List[str] = []
+        if self.pcms_process is not None:
+            output = self.pcms_process.readAllStandardOutput().data().decode()
             self.logger.error(f"Snapclient output: {output}")
             device_pattern = r":\s*(.+)$"
-            device_names: List[str] = re.findall(device_pattern, output, re.MULTILINE)
+            device_names = re.findall(device_pattern, output, re.MULTILINE)
 
         if device_names:
             self.pcms_dropdown.clear()
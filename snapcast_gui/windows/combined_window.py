@@ -129,14 +129,14 @@ class CombinedWindow(QMainWindow):
                     if os.path.exists(program_path) and os.access(program_path, os.X_OK):
                         return program_path
 
-            dialog = PathInputDialog(program_name, self.log_level)
+            dialog = PathInputDialog(program_name, self.snapcast_settings, self.log_level)
             if dialog.exec() == QDialog.Accepted:
                 program_path = dialog.get_path()
                 if os.path.exists(program_path) and os.access(program_path, os.X_OK):
                     return program_path
 
         elif sys.platform == "win32": 
-            dialog = PathInputDialog(program_name, self.log_level)
+            dialog = PathInputDialog(program_name, self.snapcast_settings, self.log_level)
             if dialog.exec() == QDialog.Accepted:
                 program_path = dialog.get_path()
                 if os.path.exists(program_path):
@@ -1,10 +1,9 @@
 import logging
 import os
 import shutil
-import subprocess
 import sys
 
-from PySide6.QtCore import QStandardPaths, Qt, QUrl, QTimer
+from PySide6.QtCore import QObject, QProcess, QStandardPaths, Qt, QUrl, QTimer
 from PySide6.QtGui import QIcon, QTextCursor, QDesktopServices
 from PySide6.QtWidgets import (
     QApplication,
@@ -26,7 +25,7 @@ from PySide6.QtWidgets import (
 
 from snapcast_gui.misc.snapcast_gui_variables import SnapcastGuiVariables
 
-from typing import Optional, TYPE_CHECKING
+from typing import Callable, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from snapcast_gui.fileactions.snapcast_settings import SnapcastSettings
@@ -38,6 +37,9 @@ class SettingsWindow(QMainWindow):
     Represents the settings window of the Snapcast-Gui application.
     """
 
+    # executable path -> ((mtime, size), version)
+    _program_versions = {}
+
     def __init__(self, snapcast_settings: "SnapcastSettings", main_window: "MainWindow", log_level: int):
         super().__init__()
         self.logger = logging.getLogger("SettingsWindow")
@@ -47,6 +49,7 @@ class SettingsWindow(QMainWindow):
         self.main_window = main_window
         self.log_file_path = SnapcastGuiVariables.log_file_path
         self.log_level_file_path = SnapcastGuiVariables.log_level_file_path
+        self.version_checker: Optional[SnapcastGuiVariables] = None
 
         self.setWindowTitle("Snapcast Gui Settings")
         self.setMinimumSize(700, 400)
@@ -277,14 +280,15 @@ class SettingsWindow(QMainWindow):
         else:
             self.custom_snapclient_path_text.setEnabled(False)
             
-        snapclient_version_text = QLabel()
-        snapclient_version, _ = self.get_versions()
-        if snapclient_version != "":
-            snapclient_version_text.setText("Snapclient version " + snapclient_version)
-        else:
-            snapclient_version_text.setText("Can't pull snapclient version")
-        
+        snapclient_version_text = QLabel("Snapclient version: checking...")
         self.settings_layout.addWidget(snapclient_version_text)
+        self.request_program_version(
+            self.snapcast_settings.read_setting("snapclient/custom_path"),
+            lambda version: snapclient_version_text.setText(
+                "Snapclient version " + version if version else "Can't pull snapclient version"
+            ),
+            snapclient_version_text,
+        )
         
 
     def setup_snapclient_autostart_settings(self, autostart_snapclient: bool):
@@ -382,13 +386,15 @@ class SettingsWindow(QMainWindow):
         else:
             custom_snapserver_path_text.setEnabled(False)
             
-        snapserver_version_text = QLabel()
-        _ , snapserver_version = self.get_versions()
-        if snapserver_version != "":
-            snapserver_version_text.setText("Snapserver version " + snapserver_version)
-        else:
-            snapserver_version_text.setText("Can't pull snapserver version")
+        snapserver_version_text = QLabel("Snapserver version: checking...")
         self.settings_layout.addWidget(snapserver_version_text)
+        self.request_program_version(
+            self.snapcast_settings.read_setting("snapserver/custom_path"),
+            lambda version: snapserver_version_text.setText(
+                "Snapserver version " + version if version else "Can't pull snapserver version"
+            ),
+            snapserver_version_text,
+        )
 
     def setup_shortcut_settings(self):
         """
@@ -623,18 +629,27 @@ class SettingsWindow(QMainWindow):
         )
         snapcast_gui_version_label.setObjectName("snapcast_gui_version_label")
         self.settings_layout.addWidget(snapcast_gui_version_label)
-        snapclient_version, snapserver_version = self.get_versions()
-        snapclient_version_label = QLabel(f"Snapclient Version: {snapclient_version}")
+        snapclient_version_label = QLabel("Snapclient Version: ")
         snapclient_version_label.setObjectName("snapclient_version_label")
         self.settings_layout.addWidget(snapclient_version_label)
+        self.request_program_version(
+            self.snapcast_settings.read_setting("snapclient/custom_path"),
+            lambda version: snapclient_version_label.setText(f"Snapclient Version: {version}"),
+            snapclient_version_label,
+        )
 
         if sys.platform == "windows":
             snapserver_version_label = QLabel(f"Snapserver Version: Unsupported on windws")
             snapserver_version_label.setObjectName("snapserver_version_label")
             snapserver_version_label.setToolTip("Snapserver version is only available on Linux")
         else:
-            snapserver_version_label = QLabel(f"Snapserver Version: {snapserver_version}")
+            snapserver_version_label = QLabel("Snapserver Version: ")
             snapserver_version_label.setObjectName("snapserver_version_label")
+            self.request_program_version(
+                self.snapcast_settings.read_setting("snapserver/custom_path"),
+                lambda version: snapserver_version_label.setText(f"Snapserver Version: {version}"),
+                snapserver_version_label,
+            )
 
         self.settings_layout.addWidget(snapserver_version_label)
 
@@ -658,7 +673,18 @@ class SettingsWindow(QMainWindow):
         """
         Checks the latest version of Snapcast-Gui on Github.
         """
-        latest_version = SnapcastGuiVariables.get_latest_version(SnapcastGuiVariables.snapcast_gui_github_url)
+        if self.version_checker is None:
+            self.version_checker = SnapcastGuiVariables()
+            self.version_checker.latest_version_fetched.connect(self.on_latest_version_fetched)
+        self.version_checker.get_latest_version(SnapcastGuiVariables.snapcast_gui_github_url)
+
+    def on_latest_version_fetched(self, latest_version: str):
+        """
+        Tells the user whether a newer version of Snapcast-Gui is available.
+
+        Parameters:
+            latest_version: The latest release tag, or an empty string if it couldn't be fetched.
+        """
         if latest_version:
             if latest_version != SnapcastGuiVariables.snapcast_gui_version:
                 QMessageBox.information(
@@ -672,23 +698,60 @@ class SettingsWindow(QMainWindow):
                     "No New Version Available",
                     f"Snapcast-Gui is up to date: {SnapcastGuiVariables.snapcast_gui_version}",
                 )
+        else:
+            self.logger.error("Could not fetch the latest Snapcast-Gui version")
 
-    def get_versions(self) -> tuple[str, str]:
+    def request_program_version(
+        self, program_path: str, on_version: Callable[[str], None], owner: QObject
+    ) -> None:
         """
-        Retrieves the versions of snapclient and snapserver using subprocess.
+        Runs `program_path --version` without blocking and passes the version to on_version,
+        or an empty string if it can't be read.
 
-        Returns:
-            A tuple containing the snapclient version and snapserver version.
+        The result is cached until the executable's modification time or size changes. The process
+        is parented to owner, so it goes away together with the widget that shows the result.
         """
-        snapclient_version = subprocess.run(
-            [self.snapcast_settings.read_setting("snapclient/custom_path"), "--version"], capture_output=True, text=True
-        ).stdout.split()[1]
-        snapserver_version = subprocess.run(
-            [self.snapcast_settings.read_setting("snapserver/custom_path"), "--version"], capture_output=True, text=True
-        ).stdout.split()[1]
-        self.logger.debug(f"Snapclient version: {snapclient_version}")
-        self.logger.debug(f"Snapserver version: {snapserver_version}")
-        return snapclient_version, snapserver_version
+        try:
+            stat = os.stat(program_path)
+        except (OSError, TypeError, ValueError):
+            on_version("")
+            return
+        key = (stat.st_mtime_ns, stat.st_size)
+        cached = SettingsWindow._program_versions.get(program_path)
+        if cached is not None and cached[0] == key:
+            on_version(cached[1])
+            return
+
+        process = QProcess(owner)
+        process.setProgram(program_path)
+        process.setArguments(["--version"])
+        process.setStandardErrorFile(QProcess.nullDevice())
+        timeout = QTimer(process)
+        timeout.setSingleShot(True)
+        timeout.timeout.connect(process.kill)
+
+        def finish() -> None:
+            timeout.stop()
+            output = process.readAllStandardOutput().data()
+            # The first line reads e.g. "snapclient v0.27.0"
+            parts = output.decode(errors="replace").partition("\n")[0].split(maxsplit=2)
+            version = parts[1] if len(parts) >= 2 else ""
+            self.logger.debug(f"{program_path} version: {version}")
+            SettingsWindow._program_versions[program_path] = (key, version)
+            on_version(version)
+            process.deleteLater()
+
+        def fail(error: QProcess.ProcessError) -> None:
+            # A process that failed to start never emits finished
+            if error == QProcess.FailedToStart:
+                timeout.stop()
+                on_version("")
+                process.deleteLater()
+
+        process.finished.connect(finish)
+        process.errorOccurred.connect(fail)
+        process.start()
+        timeout.start(5000)
 
     def open_file(self, file_path: str):
         """